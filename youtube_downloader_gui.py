@@ -3,25 +3,116 @@
 YouTube Video Downloader with Modern GUI
 Requires: yt-dlp, tkinter (usually pre-installed)
 Install yt-dlp with: pip install yt-dlp
+Optional: diskcache (pip install diskcache) to cache video info between runs
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import subprocess
-import json
+from tkinter import ttk, messagebox
+import atexit
+import collections
+import re
 import threading
+import time
 import os
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+# How long fetched video info stays in the metadata cache (seconds)
+META_CACHE_TTL = 24 * 60 * 60
+# Bump when the layout of cached video info changes
+META_CACHE_VERSION = 3
+
+# Keep ANSI color codes out of the status log and error dialogs
+NO_COLOR = {'stdout': 'no_color', 'stderr': 'no_color'}
+
+# Options for metadata extraction: only the format table is needed, so skip
+# playlists, subtitles, comments and the extra DASH manifest request
+FETCH_OPTS = {
+    'quiet': True,
+    'color': NO_COLOR,
+    'skip_download': True,
+    'noplaylist': True,
+    'extract_flat': False,
+    'writesubtitles': False,
+    'writeautomaticsub': False,
+    'getcomments': False,
+    'extractor_args': {'youtube': {'skip': ['dash', 'translated_subs']}},
+}
+
+# Number of URLs fetched at the same time
+MAX_FETCH_WORKERS = 4
+# Number of downloads running at the same time
+MAX_DOWNLOAD_WORKERS = 4
+
+# Minimum time between UI updates sent from worker threads (seconds)
+UI_FLUSH_INTERVAL = 0.08
+# Maximum number of log lines held back before forcing a flush
+MAX_PENDING_LINES = 32
+
+# Number of lines kept in the status log
+LOG_MAX_LINES = 200
+# How often the status log widget is redrawn (milliseconds)
+LOG_REFRESH_MS = 100
+
+# yt-dlp progress line, e.g. "[download]  42.5% of 10.00MiB at 1.20MiB/s ETA 00:07"
+_PROGRESS_RE = re.compile(r'\[download\]\s+\d+(?:\.\d+)?%')
+
+class StatusLogger:
+    """Forward yt-dlp log messages to the GUI status log in batches"""
+    def __init__(self, app):
+        self.app = app
+        self._buf = []
+        self._progress_line = None
+        self._last_flush = time.monotonic()
+
+    def debug(self, msg):
+        # Consecutive progress lines supersede each other, so only the latest
+        # one is kept; any other message ends the run and keeps its place
+        if _PROGRESS_RE.match(msg):
+            self._progress_line = msg
+        else:
+            if self._progress_line is not None:
+                self._buf.append(self._progress_line)
+                self._progress_line = None
+            self._buf.append(msg)
+        if (time.monotonic() - self._last_flush > UI_FLUSH_INTERVAL
+                or len(self._buf) > MAX_PENDING_LINES):
+            self.flush()
+
+    def flush(self):
+        """Send buffered lines to the UI thread as a single update"""
+        if self._progress_line is not None:
+            self._buf.append(self._progress_line)
+            self._progress_line = None
+        if self._buf:
+            self.app.post_to_ui(self.app.log_status, "\n".join(self._buf))
+            self._buf.clear()
+        self._last_flush = time.monotonic()
+
+    def warning(self, msg):
+        # yt-dlp only adds the prefix itself when it prints to the console
+        self.debug(f"WARNING: {msg}")
+
+    info = debug
+    error = debug
 
 class ModernButton(tk.Canvas):
     """Custom modern button with hover effects"""
-    def __init__(self, parent, text, command, bg_color="#3b82f6", hover_color="#2563eb", **kwargs):
-        super().__init__(parent, height=40, bg=parent['bg'], highlightthickness=0, **kwargs)
+    def __init__(self, parent, text, command, bg_color="#3b82f6", hover_color="#2563eb", bg=None, **kwargs):
+        # Pass bg when it is already known to avoid querying the parent through Tcl
+        super().__init__(parent, height=40, bg=parent['bg'] if bg is None else bg,
+                         highlightthickness=0, **kwargs)
         self.command = command
         self.bg_color = bg_color
         self.hover_color = hover_color
         self.text = text
         self.enabled = True
+        self._w = self._h = -1
+        self._fill = bg_color
         
         self.rect = self.create_rectangle(0, 0, 0, 0, fill=bg_color, outline="", tags="button")
         self.text_id = self.create_text(0, 0, text=text, fill="white", font=("Segoe UI", 10, "bold"), tags="button")
@@ -32,16 +123,26 @@ class ModernButton(tk.Canvas):
         self.bind("<Button-1>", self._on_click)
         
     def _resize(self, event):
+        # Some window managers send <Configure> without a size change
+        if event.width == self._w and event.height == self._h:
+            return
+        self._w, self._h = event.width, event.height
         self.coords(self.rect, 0, 0, event.width, event.height)
         self.coords(self.text_id, event.width/2, event.height/2)
         
+    def _set_fill(self, color):
+        """Recolor the button only if the color actually changes"""
+        if color != self._fill:
+            self._fill = color
+            self.itemconfig(self.rect, fill=color)
+        
     def _on_enter(self, event):
         if self.enabled:
-            self.itemconfig(self.rect, fill=self.hover_color)
+            self._set_fill(self.hover_color)
             
     def _on_leave(self, event):
         if self.enabled:
-            self.itemconfig(self.rect, fill=self.bg_color)
+            self._set_fill(self.bg_color)
             
     def _on_click(self, event):
         if self.enabled and self.command:
@@ -50,9 +151,9 @@ class ModernButton(tk.Canvas):
     def configure_state(self, state):
         self.enabled = state == 'normal'
         if not self.enabled:
-            self.itemconfig(self.rect, fill="#6b7280")
+            self._set_fill("#6b7280")
         else:
-            self.itemconfig(self.rect, fill=self.bg_color)
+            self._set_fill(self.bg_color)
 
 class YouTubeDownloader:
     def __init__(self, root):
@@ -69,6 +170,7 @@ class YouTubeDownloader:
             'primary': '#3b82f6',      # Blue
             'primary_hover': '#2563eb',
             'success': '#10b981',      # Green
+            'danger': '#ef4444',       # Red
             'text': '#f1f5f9',         # Light text
             'text_secondary': '#94a3b8', # Secondary text
             'border': '#334155',       # Border color
@@ -78,189 +180,286 @@ class YouTubeDownloader:
         self.root.configure(bg=self.colors['bg'])
         
         # Get Downloads folder
-        self.download_path = str(Path.home() / "Downloads")
+        self.download_path = os.path.expanduser(os.path.join("~", "Downloads"))
+        self._download_path_display = f"💾 Downloads saved to: {self.download_path}"
+        
+        # On-disk cache of fetched video info, keyed by URL
+        self._meta_cache = Cache(os.path.expanduser(os.path.join("~", ".cache", "ytdl_gui"))) if Cache else None
+        
+        # yt-dlp module, imported on first use by a worker thread
+        self._ytdlp = None
+        
+        # One metadata YoutubeDL per worker thread, closed at exit
+        self._tls = threading.local()
+        self._fetch_ydls = []
+        atexit.register(self._close_fetch_ydls)
+        
+        # Separate worker pools so long downloads never hold up a fetch
+        self._fetch_pool = ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS)
+        self._download_pool = ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS)
+        self._cancel = threading.Event()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Create GUI elements
         self.create_widgets()
         
     def create_widgets(self):
+        c = self.colors
+        
+        # Menu
+        menubar = tk.Menu(self.root)
+        tools_menu = tk.Menu(menubar, tearoff=0)
+        tools_menu.add_command(label="Clear cache", command=self.clear_cache,
+                               state=tk.NORMAL if self._meta_cache is not None else tk.DISABLED)
+        menubar.add_cascade(label="Tools", menu=tools_menu)
+        self.root.config(menu=menubar)
+        
         # Main container
-        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame = tk.Frame(self.root, bg=c['bg'])
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Header
-        header = tk.Frame(main_frame, bg=self.colors['bg'])
+        header = tk.Frame(main_frame, bg=c['bg'])
         header.pack(fill=tk.X, pady=(0, 20))
         
         title = tk.Label(header, text="📥 YouTube Downloader", 
                         font=("Segoe UI", 24, "bold"),
-                        bg=self.colors['bg'], fg=self.colors['text'])
+                        bg=c['bg'], fg=c['text'])
         title.pack(side=tk.LEFT)
         
         subtitle = tk.Label(header, text="Download videos in your preferred quality", 
                            font=("Segoe UI", 10),
-                           bg=self.colors['bg'], fg=self.colors['text_secondary'])
+                           bg=c['bg'], fg=c['text_secondary'])
         subtitle.pack(side=tk.LEFT, padx=(10, 0), pady=(8, 0))
         
         # URL Card
-        url_card = tk.Frame(main_frame, bg=self.colors['card'], highlightbackground=self.colors['border'], 
+        url_card = tk.Frame(main_frame, bg=c['card'], highlightbackground=c['border'], 
                            highlightthickness=1)
         url_card.pack(fill=tk.X, pady=(0, 15))
         
-        url_inner = tk.Frame(url_card, bg=self.colors['card'])
+        url_inner = tk.Frame(url_card, bg=c['card'])
         url_inner.pack(fill=tk.X, padx=20, pady=15)
         
-        url_label = tk.Label(url_inner, text="Video URL", 
+        url_label = tk.Label(url_inner, text="Video URLs (one per line)", 
                             font=("Segoe UI", 11, "bold"),
-                            bg=self.colors['card'], fg=self.colors['text'])
+                            bg=c['card'], fg=c['text'])
         url_label.pack(anchor=tk.W, pady=(0, 8))
         
-        # Custom styled entry
-        self.url_entry = tk.Entry(url_inner, font=("Segoe UI", 11),
-                                 bg=self.colors['bg'], fg=self.colors['text'],
-                                 insertbackground=self.colors['text'],
-                                 relief=tk.FLAT, highlightthickness=2,
-                                 highlightbackground=self.colors['border'],
-                                 highlightcolor=self.colors['primary'])
-        self.url_entry.pack(fill=tk.X, ipady=8, ipadx=10)
+        # Custom styled multi-line entry
+        self.url_text = tk.Text(url_inner, font=("Segoe UI", 11),
+                                bg=c['bg'], fg=c['text'],
+                                insertbackground=c['text'],
+                                relief=tk.FLAT, highlightthickness=2,
+                                highlightbackground=c['border'],
+                                highlightcolor=c['primary'],
+                                height=3, wrap=tk.NONE, padx=10, pady=8)
+        self.url_text.pack(fill=tk.X)
         
         # Fetch button
-        btn_frame = tk.Frame(url_inner, bg=self.colors['card'])
+        btn_frame = tk.Frame(url_inner, bg=c['card'])
         btn_frame.pack(fill=tk.X, pady=(15, 0))
         
         self.fetch_btn = ModernButton(btn_frame, "🔍 Fetch Video Info", 
                                       command=self.fetch_formats,
-                                      bg_color=self.colors['primary'],
-                                      hover_color=self.colors['primary_hover'],
+                                      bg_color=c['primary'],
+                                      hover_color=c['primary_hover'],
+                                      bg=c['card'],
                                       width=200)
         self.fetch_btn.pack(side=tk.LEFT)
         
         # Video info card
-        self.info_card = tk.Frame(main_frame, bg=self.colors['card'], 
-                                 highlightbackground=self.colors['border'], 
+        self.info_card = tk.Frame(main_frame, bg=c['card'], 
+                                 highlightbackground=c['border'], 
                                  highlightthickness=1)
         
-        info_inner = tk.Frame(self.info_card, bg=self.colors['card'])
+        info_inner = tk.Frame(self.info_card, bg=c['card'])
         info_inner.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
         
-        self.title_label = tk.Label(info_inner, text="", 
+        # Video selector, only shown when several URLs were fetched
+        self.video_combo = ttk.Combobox(info_inner, state='readonly', font=("Segoe UI", 10))
+        self.video_combo.bind("<<ComboboxSelected>>",
+                              lambda e: self._show_video(self.video_combo.current()))
+        
+        self._title_var = tk.StringVar()
+        self.title_label = tk.Label(info_inner, textvariable=self._title_var, 
                                     font=("Segoe UI", 12, "bold"),
-                                    bg=self.colors['card'], fg=self.colors['text'],
+                                    bg=c['card'], fg=c['text'],
                                     wraplength=720, justify=tk.LEFT)
         self.title_label.pack(anchor=tk.W, pady=(0, 10))
         
         # Quality selection card
         quality_label = tk.Label(info_inner, text="Select Quality", 
                                 font=("Segoe UI", 11, "bold"),
-                                bg=self.colors['card'], fg=self.colors['text'])
+                                bg=c['card'], fg=c['text'])
         quality_label.pack(anchor=tk.W, pady=(10, 8))
         
-        # Custom listbox
-        list_frame = tk.Frame(info_inner, bg=self.colors['bg'], 
-                             highlightbackground=self.colors['border'],
+        # Format table
+        style = ttk.Style(self.root)
+        style.theme_use('clam')  # the native themes ignore custom Treeview colors
+        style.configure("Formats.Treeview", background=c['bg'], fieldbackground=c['bg'],
+                        foreground=c['text'], font=("Consolas", 10), rowheight=22, borderwidth=0)
+        style.configure("Formats.Treeview.Heading", background=c['card'], foreground=c['text_secondary'],
+                        font=("Segoe UI", 9, "bold"), relief=tk.FLAT)
+        style.map("Formats.Treeview", background=[('selected', c['primary'])],
+                  foreground=[('selected', "white")])
+        
+        list_frame = tk.Frame(info_inner, bg=c['bg'], 
+                             highlightbackground=c['border'],
                              highlightthickness=1)
         list_frame.pack(fill=tk.X, pady=(0, 15))
         
-        scrollbar = tk.Scrollbar(list_frame, bg=self.colors['card'])
+        scrollbar = tk.Scrollbar(list_frame, bg=c['card'])
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.format_listbox = tk.Listbox(list_frame, 
+        columns = (('res', "Resolution", 200), ('fps', "FPS", 80), ('ext', "Format", 100),
+                   ('audio', "Audio", 160), ('size', "Size", 120))
+        self.format_tree = ttk.Treeview(list_frame,
+                                        columns=[col for col, _, _ in columns],
+                                        show='headings',
+                                        selectmode='browse',
+                                        style="Formats.Treeview",
                                         yscrollcommand=scrollbar.set,
-                                        font=("Consolas", 10),
-                                        bg=self.colors['bg'],
-                                        fg=self.colors['text'],
-                                        selectbackground=self.colors['primary'],
-                                        selectforeground="white",
-                                        relief=tk.FLAT,
-                                        highlightthickness=0,
-                                        height=6,
-                                        activestyle='none')
-        self.format_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2, pady=2)
-        scrollbar.config(command=self.format_listbox.yview)
+                                        height=6)
+        for col, heading, width in columns:
+            self.format_tree.heading(col, text=heading, anchor=tk.W)
+            self.format_tree.column(col, width=width, anchor=tk.W)
+        self.format_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2, pady=2)
+        scrollbar.config(command=self.format_tree.yview)
         
         # Download button
         self.download_btn = ModernButton(info_inner, "⬇️ Download Video", 
                                         command=self.start_download,
-                                        bg_color=self.colors['success'],
+                                        bg_color=c['success'],
                                         hover_color="#059669",
+                                        bg=c['card'],
                                         width=200)
         self.download_btn.configure_state('disabled')
         self.download_btn.pack(anchor=tk.W, pady=(0, 5))
         
         # Progress card
-        self.progress_card = tk.Frame(main_frame, bg=self.colors['card'], 
-                                     highlightbackground=self.colors['border'], 
+        self.progress_card = tk.Frame(main_frame, bg=c['card'], 
+                                     highlightbackground=c['border'], 
                                      highlightthickness=1)
         
-        progress_inner = tk.Frame(self.progress_card, bg=self.colors['card'])
+        progress_inner = tk.Frame(self.progress_card, bg=c['card'])
         progress_inner.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
         
-        progress_label = tk.Label(progress_inner, text="Download Progress", 
+        # Header with cancel button, visible whenever downloads are running
+        progress_header = tk.Frame(progress_inner, bg=c['card'])
+        progress_header.pack(fill=tk.X, pady=(0, 10))
+        
+        progress_label = tk.Label(progress_header, text="Download Progress", 
                                  font=("Segoe UI", 11, "bold"),
-                                 bg=self.colors['card'], fg=self.colors['text'])
-        progress_label.pack(anchor=tk.W, pady=(0, 10))
+                                 bg=c['card'], fg=c['text'])
+        progress_label.pack(side=tk.LEFT)
+        
+        self.cancel_btn = ModernButton(progress_header, "⏹️ Cancel Downloads", 
+                                      command=self.cancel_downloads,
+                                      bg_color=c['danger'],
+                                      hover_color="#dc2626",
+                                      bg=c['card'],
+                                      width=200)
+        self.cancel_btn.configure_state('disabled')
+        self.cancel_btn.pack(side=tk.RIGHT)
         
         # Custom progress bar
-        progress_bg = tk.Frame(progress_inner, bg=self.colors['bg'], height=8,
-                              highlightbackground=self.colors['border'],
+        progress_bg = tk.Frame(progress_inner, bg=c['bg'], height=8,
+                              highlightbackground=c['border'],
                               highlightthickness=1)
         progress_bg.pack(fill=tk.X, pady=(0, 10))
         
-        self.progress_fill = tk.Frame(progress_bg, bg=self.colors['primary'], height=6)
+        self.progress_fill = tk.Frame(progress_bg, bg=c['primary'], height=6)
         self.progress_fill.place(x=1, y=1, width=0, height=6)
+        self._last_fill_w = 0
         
         # Status text
         self.status_text = tk.Text(progress_inner, 
                                   font=("Consolas", 9),
-                                  bg=self.colors['bg'],
-                                  fg=self.colors['text'],
+                                  bg=c['bg'],
+                                  fg=c['text'],
                                   relief=tk.FLAT,
                                   height=6,
                                   wrap=tk.WORD,
                                   state='disabled',
-                                  highlightbackground=self.colors['border'],
+                                  highlightbackground=c['border'],
                                   highlightthickness=1)
         self.status_text.pack(fill=tk.BOTH, expand=True)
         
         # Footer
-        footer = tk.Frame(main_frame, bg=self.colors['bg'])
+        footer = tk.Frame(main_frame, bg=c['bg'])
         footer.pack(fill=tk.X, pady=(15, 0))
         
+        self._location_var = tk.StringVar(value=self._download_path_display)
         location_label = tk.Label(footer, 
-                                 text=f"💾 Downloads saved to: {self.download_path}", 
+                                 textvariable=self._location_var, 
                                  font=("Segoe UI", 9),
-                                 bg=self.colors['bg'], 
-                                 fg=self.colors['text_secondary'])
+                                 bg=c['bg'], 
+                                 fg=c['text_secondary'])
         location_label.pack(side=tk.LEFT)
         
-        self.formats = []
-        self.is_downloading = False
+        self.videos = []
+        self.current_video = None
+        self._fetch_pending = 0
+        self._active_downloads = {}
+        self._download_futures = {}
+        self._downloads_in_flight = {}
+        self._cancelled = set()
+        self._download_seq = 0
+        self._log_buf = collections.deque(maxlen=LOG_MAX_LINES)
+        self._log_dirty = False
+        self.root.after(LOG_REFRESH_MS, self._refresh_log)
         
     def update_progress(self, percentage):
         """Update progress bar with actual percentage"""
         max_width = 756  # Approximate width of progress bar
         width = int((percentage / 100) * max_width)
-        self.progress_fill.config(width=width)
+        # Skip the geometry pass when the bar would not change by a pixel
+        if width == self._last_fill_w:
+            return
+        self._last_fill_w = width
+        # The placer's width overrides the frame's own, so resize through it
+        self.progress_fill.place_configure(width=width)
+        
+    def post_to_ui(self, func, *args):
+        """Schedule func on the UI thread unless the window is closing"""
+        if not self._cancel.is_set():
+            self.root.after(0, func, *args)
         
     def log_status(self, message):
-        """Add message to status text"""
-        self.status_text.config(state='normal')
-        self.status_text.insert(tk.END, message + "\n")
-        self.status_text.see(tk.END)
-        self.status_text.config(state='disabled')
+        """Add message to the status log, shown on the next refresh"""
+        self._log_buf.extend(message.split("\n"))
+        self._log_dirty = True
+        
+    def _refresh_log(self):
+        """Redraw the status text from the bounded log buffer"""
+        if self._log_dirty:
+            self._log_dirty = False
+            self.status_text.config(state='normal')
+            self.status_text.delete('1.0', tk.END)
+            self.status_text.insert('1.0', "\n".join(self._log_buf))
+            self.status_text.see(tk.END)
+            self.status_text.config(state='disabled')
+        self.root.after(LOG_REFRESH_MS, self._refresh_log)
+        
+    def _get_urls(self):
+        """Return the non-empty, de-duplicated lines of the URL box"""
+        lines = (line.strip() for line in self.url_text.get("1.0", tk.END).splitlines())
+        return list(dict.fromkeys(line for line in lines if line))
         
     def fetch_formats(self):
-        """Fetch available formats for the video"""
-        url = self.url_entry.get().strip()
+        """Fetch available formats for every entered video"""
+        urls = self._get_urls()
         
-        if not url:
+        if not urls:
             messagebox.showerror("Error", "Please enter a YouTube URL")
             return
             
         self.fetch_btn.configure_state('disabled')
         self.download_btn.configure_state('disabled')
-        self.format_listbox.delete(0, tk.END)
-        self.formats = []
+        self.format_tree.delete(*self.format_tree.get_children())
+        self.videos = []
+        self.current_video = None
+        self.video_combo.pack_forget()
         
         # Hide cards initially
         self.info_card.pack_forget()
@@ -268,159 +467,295 @@ class YouTubeDownloader:
         
         # Show progress
         self.progress_card.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
-        self.log_status("🔍 Fetching video information...")
+        self.log_status(f"🔍 Fetching video information for {len(urls)} URL(s)...")
         self.update_progress(0)
         
-        # Run in thread
-        thread = threading.Thread(target=self._fetch_formats_thread, args=(url,))
-        thread.daemon = True
-        thread.start()
+        # Fetch all URLs concurrently
+        self._fetch_pending = len(urls)
+        for url in urls:
+            future = self._fetch_pool.submit(self._fetch_one, url)
+            future.add_done_callback(
+                lambda f, url=url: self.post_to_ui(self._on_fetch_done, url, f))
+        
+    def _fetch_one(self, url):
+        """Worker function to fetch title and formats for one URL"""
+        key = (META_CACHE_VERSION, url)
+        info = self._meta_cache.get(key) if self._meta_cache is not None else None
+        
+        if info is None:
+            info = self._extract_video_info(url)
+            if self._meta_cache is not None:
+                self._meta_cache.set(key, info, expire=META_CACHE_TTL)
+        
+        return dict(info, url=url)
+        
+    def _on_fetch_done(self, url, future):
+        """Handle a finished fetch on the UI thread"""
+        self._fetch_pending -= 1
         
-    def _fetch_formats_thread(self, url):
-        """Thread function to fetch formats"""
         try:
-            cmd = ['yt-dlp', '-J', url]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            video_info = json.loads(result.stdout)
+            self._add_video(future.result())
+        except CancelledError:
+            pass
+        except ImportError:
+            messagebox.showerror("Error", "yt-dlp not found. Install it with: pip install yt-dlp")
+        except Exception as e:
+            if self._ytdlp is not None and isinstance(e, self._ytdlp.utils.DownloadError):
+                messagebox.showerror("Error", f"Failed to fetch video info for {url}:\n{e}")
+            else:
+                messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
+        
+        if self._fetch_pending == 0:
+            if self.videos:
+                self.fetch_btn.configure_state('normal')
+            else:
+                self._reset_ui()
             
-            title = video_info.get('title', 'Unknown')
-            formats = video_info.get('formats', [])
+    def _load_yt_dlp(self):
+        """Import yt-dlp on first use, it loads hundreds of extractor modules"""
+        if self._ytdlp is None:
+            import yt_dlp
+            self._ytdlp = yt_dlp
+        return self._ytdlp
+        
+    def _close_fetch_ydls(self):
+        """Close the per-thread metadata YoutubeDL instances"""
+        for ydl in self._fetch_ydls:
+            ydl.close()
+        self._fetch_ydls.clear()
+        
+    def _extract_video_info(self, url):
+        """Extract title and downloadable formats with yt-dlp"""
+        # YoutubeDL is not thread-safe, but each pool thread can reuse its own
+        ydl = getattr(self._tls, 'ydl', None)
+        if ydl is None:
+            ydl = self._tls.ydl = self._load_yt_dlp().YoutubeDL(FETCH_OPTS)
+            self._fetch_ydls.append(ydl)
+        
+        video_info = ydl.extract_info(url, download=False)
+        
+        title = video_info.get('title', 'Unknown')
+        formats = video_info.get('formats', [])
+        
+        # Process formats, skipping duplicate resolution/audio combinations
+        seen = set()
+        unique_formats = []
+        for f in formats:
+            if f.get('vcodec') == 'none':
+                continue
             
-            # Process formats
-            video_formats = []
-            for f in formats:
-                if f.get('vcodec') != 'none':
-                    format_id = f.get('format_id')
-                    ext = f.get('ext')
-                    resolution = f.get('resolution', 'audio only')
-                    fps = f.get('fps', 0)
-                    acodec = f.get('acodec', 'none')
-                    filesize = f.get('filesize') or f.get('filesize_approx', 0)
-                    
-                    if filesize:
-                        size_mb = filesize / (1024 * 1024)
-                        size_str = f"{size_mb:.1f}MB"
-                    else:
-                        size_str = "Unknown"
-                    
-                    audio_info = "🔊 Audio" if acodec != 'none' else "🔇 No Audio"
-                    fps_info = f" • {fps}fps" if fps else ""
-                    
-                    video_formats.append({
-                        'id': format_id,
-                        'description': f"📹 {resolution}{fps_info} • {ext} • {audio_info} • {size_str}",
-                        'resolution': resolution,
-                        'has_audio': acodec != 'none'
-                    })
+            resolution = f.get('resolution', 'audio only')
+            acodec = f.get('acodec', 'none')
+            has_audio = acodec != 'none'
+            key = (resolution, has_audio)
+            if key in seen:
+                continue
+            seen.add(key)
             
-            # Remove duplicates
-            seen = set()
-            unique_formats = []
-            for f in video_formats:
-                key = (f['resolution'], f['has_audio'])
-                if key not in seen:
-                    seen.add(key)
-                    unique_formats.append(f)
+            ext = f.get('ext')
+            fps = f.get('fps', 0)
+            filesize = f.get('filesize') or f.get('filesize_approx', 0)
             
-            # Update GUI
-            self.root.after(0, self._update_formats_ui, title, unique_formats)
+            if filesize:
+                size_mb = filesize / (1024 * 1024)
+                size_str = f"{size_mb:.1f}MB"
+            else:
+                size_str = "Unknown"
             
-        except subprocess.CalledProcessError as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to fetch video info:\n{e}"))
-            self.root.after(0, self._reset_ui)
-        except FileNotFoundError:
-            self.root.after(0, lambda: messagebox.showerror("Error", "yt-dlp not found. Install it with: pip install yt-dlp"))
-            self.root.after(0, self._reset_ui)
-        except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"An error occurred:\n{str(e)}"))
-            self.root.after(0, self._reset_ui)
+            unique_formats.append({
+                'id': f.get('format_id'),
+                'resolution': resolution,
+                'fps': fps,
+                'ext': ext,
+                'has_audio': has_audio,
+                'size': size_str
+            })
+        
+        # Keep only what the GUI needs so cache entries stay small
+        return {'id': video_info.get('id', url), 'title': title, 'formats': unique_formats}
             
-    def _update_formats_ui(self, title, formats):
-        """Update UI with fetched formats"""
-        self.title_label.config(text=f"🎬 {title}")
-        self.formats = formats
-        
-        for f in formats:
-            self.format_listbox.insert(tk.END, f['description'])
+    def _add_video(self, video):
+        """Add a fetched video and show it if it is the first one"""
+        self.videos.append(video)
+        self.log_status(f"✅ Found {len(video['formats'])} quality options for {video['title']}")
+        
+        if self.current_video is None:
+            self._show_video(0)
+            # Show info card
+            self.info_card.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+        
+        if len(self.videos) > 1:
+            self.video_combo['values'] = [v['title'] for v in self.videos]
+            self.video_combo.current(self.current_video)
+            self.video_combo.pack(fill=tk.X, pady=(0, 10), before=self.title_label)
+            
+    def _show_video(self, index):
+        """Show title and formats of one fetched video"""
+        video = self.videos[index]
+        self.current_video = index
+        self._title_var.set(f"🎬 {video['title']}")
+        
+        tree = self.format_tree
+        tree.delete(*tree.get_children())
+        for f in video['formats']:
+            tree.insert('', tk.END, iid=f['id'],
+                        values=(f"📹 {f['resolution']}", f['fps'] or "-", f['ext'],
+                                "🔊 Audio" if f['has_audio'] else "🔇 No Audio", f['size']))
         
-        self.fetch_btn.configure_state('normal')
         self.download_btn.configure_state('normal')
-        self.log_status(f"✅ Found {len(formats)} quality options")
         
-        # Show info card
-        self.info_card.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+    def clear_cache(self):
+        """Remove all cached video info"""
+        self._meta_cache.clear()
+        messagebox.showinfo("Cache", "🧹 Cached video info cleared")
         
     def _reset_ui(self):
         """Reset UI state"""
-        self.progress_fill.config(width=0)
+        self.update_progress(0)
         self.fetch_btn.configure_state('normal')
         
     def start_download(self):
-        """Start downloading selected format"""
-        selection = self.format_listbox.curselection()
+        """Queue a download of the selected format"""
+        selection = self.format_tree.selection()
         
         if not selection:
             messagebox.showwarning("Warning", "Please select a quality option")
             return
             
-        selected_idx = selection[0]
-        selected_format = self.formats[selected_idx]
-        url = self.url_entry.get().strip()
-        
-        self.fetch_btn.configure_state('disabled')
-        self.download_btn.configure_state('disabled')
-        self.is_downloading = True
+        # Row ids are the yt-dlp format ids
+        format_id = selection[0]
+        description = " • ".join(str(v) for v in self.format_tree.item(format_id, 'values'))
+        video = self.videos[self.current_video]
+        url = video['url']
+        
+        # Downloads of one video share part files (e.g. the audio track) and
+        # the merged output name whatever the quality, so run one at a time.
+        # Key on the video id so different URLs for the same video match too.
+        if video['id'] in self._downloads_in_flight:
+            messagebox.showwarning("Warning", "This video is already being downloaded")
+            return
         
-        self.log_status(f"\n⬇️ Starting download: {selected_format['description']}")
-        self.update_progress(0)
+        self._download_seq += 1
+        download_id = self._download_seq
+        self._active_downloads[download_id] = 0.0
+        self._downloads_in_flight[video['id']] = download_id
+        
+        self.log_status(f"\n⬇️ Starting download: {description}")
+        self._show_download_progress()
+        self.cancel_btn.configure_state('normal')
+        
+        # Run download on the download pool
+        self._download_futures[download_id] = self._download_pool.submit(
+            self._download_thread, download_id, url, format_id)
+        
+    def cancel_downloads(self):
+        """Cancel all queued and running downloads"""
+        self.log_status("\n⏹️ Cancelling downloads...")
+        for download_id in list(self._active_downloads):
+            if self._download_futures[download_id].cancel():
+                # Never started, so no worker will report back
+                self._download_complete(download_id)
+            else:
+                # Picked up by the progress hook of the running download
+                self._cancelled.add(download_id)
         
-        # Run download in thread
-        thread = threading.Thread(target=self._download_thread, args=(url, selected_format['id']))
-        thread.daemon = True
-        thread.start()
+    def _download_thread(self, download_id, url, format_id):
+        """Worker function to download video"""
+        try:
+            yt_dlp = self._load_yt_dlp()
+        except ImportError:
+            self.post_to_ui(lambda: messagebox.showerror("Error", "yt-dlp not found. Install it with: pip install yt-dlp"))
+            self.post_to_ui(self._download_complete, download_id)
+            return
         
-    def _download_thread(self, url, format_id):
-        """Thread function to download video"""
+        logger = StatusLogger(self)
         try:
-            cmd = [
-                'yt-dlp',
-                '-f', f'{format_id}+bestaudio/best',
-                '-P', self.download_path,
-                '--newline',
-                url
-            ]
+            ydl_opts = {
+                'format': f'{format_id}+bestaudio/best',
+                # Match the fetch, which only lists the single video of a playlist URL
+                'noplaylist': True,
+                'paths': {'home': self.download_path},
+                'progress_hooks': [self._make_progress_hook(download_id)],
+                'logger': logger,
+                'color': NO_COLOR,
+            }
             
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True
-            )
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                try:
+                    retcode = ydl.download([url])
+                finally:
+                    logger.flush()
             
-            for line in process.stdout:
-                line = line.strip()
-                if line:
-                    self.root.after(0, self.log_status, line)
-            
-            process.wait()
-            
-            if process.returncode == 0:
-                self.root.after(0, lambda: messagebox.showinfo("Success", f"✅ Download completed!\n\nSaved to: {self.download_path}"))
-                self.root.after(0, self.log_status, "\n✅ Download completed successfully!")
+            if retcode == 0:
+                self.post_to_ui(lambda: messagebox.showinfo("Success", f"✅ Download completed!\n\nSaved to: {self.download_path}"))
+                self.post_to_ui(self.log_status, "\n✅ Download completed successfully!")
             else:
-                self.root.after(0, lambda: messagebox.showerror("Error", "❌ Download failed. Check the status log."))
+                self.post_to_ui(lambda: messagebox.showerror("Error", "❌ Download failed. Check the status log."))
                 
+        except yt_dlp.utils.DownloadCancelled:
+            self.post_to_ui(self.log_status, "⏹️ Download cancelled")
+        except yt_dlp.utils.DownloadError:
+            self.post_to_ui(lambda: messagebox.showerror("Error", "❌ Download failed. Check the status log."))
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Download error:\n{str(e)}"))
+            # Bind the message now, e is unset once the except block ends
+            msg = f"Download error:\n{e}"
+            self.post_to_ui(messagebox.showerror, "Error", msg)
         finally:
-            self.root.after(0, self._download_complete)
+            self.post_to_ui(self._download_complete, download_id)
             
-    def _download_complete(self):
-        """Reset UI after download"""
-        self.progress_fill.config(width=0)
-        self.fetch_btn.configure_state('normal')
-        self.download_btn.configure_state('normal')
-        self.is_downloading = False
+    def _make_progress_hook(self, download_id):
+        """Build a yt-dlp progress hook for one download"""
+        last_pct = 0.0
+        
+        def hook(d):
+            nonlocal last_pct
+            # Raising from a progress hook is how yt-dlp aborts a download
+            if self._cancel.is_set() or download_id in self._cancelled:
+                raise self._ytdlp.utils.DownloadCancelled()
+            if d['status'] != 'downloading':
+                return
+            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            if not total:
+                return
+            # Skip sub-percent changes, they are not worth a redraw
+            pct = d['downloaded_bytes'] * 100 / total
+            if abs(pct - last_pct) >= 1.0:
+                last_pct = pct
+                self.post_to_ui(self._on_download_progress, download_id, pct)
+        
+        return hook
+        
+    def _on_download_progress(self, download_id, percentage):
+        """Record progress of one download and refresh the bar"""
+        if download_id in self._active_downloads:
+            self._active_downloads[download_id] = percentage
+            self._show_download_progress()
+            
+    def _show_download_progress(self):
+        """Show the average progress of all running downloads"""
+        if self._active_downloads:
+            self.update_progress(sum(self._active_downloads.values()) / len(self._active_downloads))
+        else:
+            self.update_progress(0)
+            
+    def _download_complete(self, download_id):
+        """Update UI after a download finished"""
+        self._active_downloads.pop(download_id, None)
+        self._download_futures.pop(download_id, None)
+        self._cancelled.discard(download_id)
+        for video_id, in_flight_id in list(self._downloads_in_flight.items()):
+            if in_flight_id == download_id:
+                del self._downloads_in_flight[video_id]
+        self._show_download_progress()
+        if not self._active_downloads:
+            self.cancel_btn.configure_state('disabled')
+        
+    def _on_close(self):
+        """Cancel queued and running work, then close the window"""
+        self._cancel.set()
+        self._fetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._download_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
 def main():
     root = tk.Tk()